@@ -1,11 +1,13 @@
+import math
 from numbers import Number
 
 import numpy as np
-from beartype import beartype
 from beartype.typing import Union
+from numba import njit, prange
+
+from eis_toolkit.exceptions import InvalidDataShapeException
 
 
-@beartype
 def _scale_raster(
     data: np.ndarray,
     scaling_factor: Number,
@@ -23,7 +25,6 @@ def _scale_raster(
     return data * scaling_factor if scaling_factor != 1 else data
 
 
-@beartype
 def _set_flat_pixels(
     in_array: np.ndarray,
     slope_gradient: Union[np.ndarray, tuple[np.ndarray, np.ndarray]],
@@ -39,12 +40,46 @@ def _set_flat_pixels(
         parameter: The surface attribute to modify.
 
     Returns:
-        Array of the modified surface attribute.
+        Array of the modified surface attribute. The input array is returned as is if slope_tolerance is negative.
+
+    Raises:
+        InvalidDataShapeException: The slope gradient or partial derivatives do not match the shape of the input array.
     """
+    if slope_tolerance < 0:
+        return in_array
+
     replacement_value = -1 if parameter == "A" else 0
+    out_array = np.array(in_array, order="C")
 
     if slope_tolerance == 0:
         p, q = slope_gradient
-        return np.where(np.logical_and(p == 0, q == 0), replacement_value, in_array)
-    elif slope_tolerance > 0:
-        return np.where(slope_gradient <= np.radians(slope_tolerance), replacement_value, in_array)
+        if np.shape(p) != in_array.shape or np.shape(q) != in_array.shape:
+            raise InvalidDataShapeException("Expected partial derivatives to have the same shape as the input array.")
+        _set_flat_pixels_from_derivatives(out_array.reshape(-1), np.ravel(p), np.ravel(q), replacement_value)
+    else:
+        if np.shape(slope_gradient) != in_array.shape:
+            raise InvalidDataShapeException("Expected slope gradient to have the same shape as the input array.")
+        _set_flat_pixels_from_slope(
+            out_array.reshape(-1), np.ravel(slope_gradient), math.radians(slope_tolerance), replacement_value
+        )
+    return out_array
+
+
+@njit(parallel=True, cache=True)
+def _set_flat_pixels_from_derivatives(
+    out_array: np.ndarray, p: np.ndarray, q: np.ndarray, replacement_value: Number
+) -> None:
+    """Replace values in place where both partial derivatives are zero."""
+    for i in prange(out_array.size):
+        if p[i] == 0 and q[i] == 0:
+            out_array[i] = replacement_value
+
+
+@njit(parallel=True, cache=True)
+def _set_flat_pixels_from_slope(
+    out_array: np.ndarray, slope_gradient: np.ndarray, slope_tolerance: Number, replacement_value: Number
+) -> None:
+    """Replace values in place where the slope gradient (radians) is within the tolerance."""
+    for i in prange(out_array.size):
+        if slope_gradient[i] <= slope_tolerance:
+            out_array[i] = replacement_value
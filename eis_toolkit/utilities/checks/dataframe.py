@@ -2,9 +2,9 @@ import numpy as np
 import pandas as pd
 from beartype import beartype
 from beartype.typing import Sequence
+from pandas.api.types import is_bool_dtype, is_numeric_dtype, is_timedelta64_dtype
 
 
-@beartype
 def check_columns_valid(df: pd.DataFrame, columns: Sequence[str]) -> bool:
     """
     Check that all specified columns are in the dataframe.
@@ -16,7 +16,7 @@ def check_columns_valid(df: pd.DataFrame, columns: Sequence[str]) -> bool:
     Returns:
         True if all columns are found in the dataframe, otherwise False.
     """
-    return all(column in df.columns for column in columns)
+    return set(columns).issubset(df.columns)
 
 
 @beartype
@@ -29,10 +29,15 @@ def check_columns_numeric(df: pd.DataFrame, columns: Sequence[str]) -> bool:
         columns: Column names.
 
     Returns:
-        True if all columns are numeric, otherwise False.
+        True if all columns are numeric, otherwise False. Columns missing from the dataframe are not numeric.
     """
-    columns_numeric = df[columns].select_dtypes(include="number").columns.to_list()
-    return all(column in columns_numeric for column in columns)
+    # Same dtypes as select_dtypes(include="number"): numbers and timedeltas but not booleans
+    numeric_columns = {
+        column
+        for column, dtype in df.dtypes.items()
+        if (is_numeric_dtype(dtype) and not is_bool_dtype(dtype)) or is_timedelta64_dtype(dtype)
+    }
+    return all(column in numeric_columns for column in columns)
 
 
 def check_empty_dataframe(df: pd.DataFrame) -> bool:
@@ -54,8 +59,15 @@ def check_dataframe_contains_zeros(df: pd.DataFrame) -> bool:
 
     Args:
         df: Dataframe to be checked.
+
+    Returns:
+        True if any value in the dataframe equals zero, otherwise False.
     """
-    return 0 in df.values
+    # Check column by column to avoid upcasting a mixed-dtype dataframe into a single array
+    for _, column in df.items():
+        if np.any(column.to_numpy() == 0):
+            return True
+    return False
 
 
 @beartype
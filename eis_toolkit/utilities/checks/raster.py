@@ -37,24 +37,33 @@ def check_matching_crs(objects: Iterable) -> bool:
     Returns:
         True if everything matches, False if not.
     """
-    epsg_list = []
+    first_epsg = None
+    has_objects = False
+    epsg_cache = {}
 
     for object in objects:
         if not isinstance(object, (rasterio.profiles.Profile, dict)):
-            if not object.crs:
+            crs = object.crs
+            if not crs:
                 return False
-            epsg = object.crs.to_epsg()
-            epsg_list.append(epsg)
+            # Objects commonly share the same CRS instance, so resolve each instance only once.
+            # The CRS is stored alongside the EPSG code to keep its id from being reused.
+            if id(crs) not in epsg_cache:
+                epsg_cache[id(crs)] = (crs, crs.to_epsg())
+            epsg = epsg_cache[id(crs)][1]
         else:
             if "crs" in object:
-                epsg_list.append(object["crs"])
+                epsg = object["crs"]
             else:
                 return False
 
-    if len(set(epsg_list)) != 1:
-        return False
+        if not has_objects:
+            first_epsg = epsg
+            has_objects = True
+        elif epsg != first_epsg:
+            return False
 
-    return True
+    return has_objects
 
 
 @beartype
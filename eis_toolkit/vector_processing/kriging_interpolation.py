@@ -1,13 +1,177 @@
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from types import ModuleType
+
 import geopandas as gpd
 import numpy as np
+import scipy.linalg
+import shapely
 from beartype import beartype
-from beartype.typing import Literal, Union
+from beartype.typing import Literal, Optional, Union
 from pykrige.ok import OrdinaryKriging
 from pykrige.uk import UniversalKriging
 from rasterio import profiles, transform
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException, NonMatchingCrsException
 from eis_toolkit.utilities.checks.raster import check_raster_profile
+from eis_toolkit.warnings import MemoryUsageWarning
+
+try:
+    from pykrige.lib import cok  # noqa: F401
+
+    _CYTHON_BACKEND_AVAILABLE = True
+except ImportError:
+    _CYTHON_BACKEND_AVAILABLE = False
+
+try:
+    import cupy as cp
+except ImportError:
+    _CUPY_AVAILABLE = False
+else:
+    # CuPy can be installed without a usable CUDA driver or device, which only surfaces on first use
+    try:
+        _CUPY_AVAILABLE = cp.cuda.runtime.getDeviceCount() > 0
+    except RuntimeError:
+        _CUPY_AVAILABLE = False
+
+
+@lru_cache(maxsize=8)
+def _fit_kriging(
+    x: bytes,
+    y: bytes,
+    z: bytes,
+    variogram_model: Literal["linear", "power", "gaussian", "spherical", "exponential"],
+    coordinates_type: Literal["euclidean", "geographic"],
+    method: Literal["ordinary", "universal"],
+) -> Union[OrdinaryKriging, UniversalKriging]:
+    # Coordinates and values are passed as bytes to make them hashable, so that the fitted
+    # variogram is reused when kriging is repeated with identical input data
+    x, y, z = (np.frombuffer(array, dtype=np.float64) for array in (x, y, z))
+
+    if method == "universal":
+        return UniversalKriging(x, y, z, variogram_model=variogram_model, drift_terms=["regional_linear"])
+    return OrdinaryKriging(x, y, z, variogram_model=variogram_model, coordinates_type=coordinates_type)
+
+
+def _physical_memory() -> Optional[int]:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _variogram(
+    xp: ModuleType,
+    variogram_model: Literal["linear", "power", "gaussian", "spherical", "exponential"],
+    parameters: np.ndarray,
+    d: np.ndarray,
+) -> np.ndarray:
+    # Same models as in pykrige.variogram_models, written against the array module xp
+    if variogram_model == "linear":
+        slope, nugget = parameters
+        return slope * d + nugget
+    if variogram_model == "power":
+        scale, exponent, nugget = parameters
+        return scale * d**exponent + nugget
+
+    psill, range_, nugget = parameters
+    if variogram_model == "gaussian":
+        return psill * (1.0 - xp.exp(-(d**2.0) / (range_ * 4.0 / 7.0) ** 2.0)) + nugget
+    if variogram_model == "exponential":
+        return psill * (1.0 - xp.exp(-d / (range_ / 3.0))) + nugget
+    return xp.where(
+        d <= range_,
+        psill * ((3.0 * d) / (2.0 * range_) - (d**3.0) / (2.0 * range_**3.0)) + nugget,
+        psill + nugget,
+    )
+
+
+def _great_circle_distance(
+    xp: ModuleType, lon1: np.ndarray, lat1: np.ndarray, lon2: np.ndarray, lat2: np.ndarray
+) -> np.ndarray:
+    # Same formula as in pykrige.core.great_circle_distance, written against the array module xp
+    lat1 = lat1 * np.pi / 180.0
+    lat2 = lat2 * np.pi / 180.0
+    dlon = (lon1 - lon2) * np.pi / 180.0
+    c1, s1 = xp.cos(lat1), xp.sin(lat1)
+    c2, s2 = xp.cos(lat2), xp.sin(lat2)
+    cd = xp.cos(dlon)
+    return (
+        180.0
+        / np.pi
+        * xp.arctan2(xp.sqrt((c2 * xp.sin(dlon)) ** 2 + (c1 * s2 - s1 * c2 * cd) ** 2), s1 * s2 + c1 * c2 * cd)
+    )
+
+
+def _ordinary_kriging_by_rows(
+    kriging_method: OrdinaryKriging, grid_x: np.ndarray, grid_y: np.ndarray, xp: ModuleType
+) -> np.ndarray:
+    # This relies on PyKrige internals (_get_kriging_matrix, X_ADJUSTED, Y_ADJUSTED, Z, eps, exact_values
+    # and variogram_model_parameters) as they are in PyKrige 1.7, and may need updating for other versions
+    n = kriging_method.X_ADJUSTED.shape[0]
+
+    # The kriging matrix is small, so it is inverted on the CPU. Folding the data values into the
+    # inverse leaves a single weight vector, making the prediction a matrix-vector product per row
+    a_inv = scipy.linalg.inv(kriging_method._get_kriging_matrix(n))
+    weights = xp.asarray(a_inv.T @ np.append(kriging_method.Z, 0.0))
+
+    # Anisotropy is not used, so the adjusted data coordinates are in the same space as the grid
+    x_data = xp.asarray(kriging_method.X_ADJUSTED)
+    y_data = xp.asarray(kriging_method.Y_ADJUSTED)
+    row_x = xp.asarray(grid_x)[:, np.newaxis]
+
+    z_interpolated = xp.empty((grid_y.size, grid_x.size))
+    for row, row_y in enumerate(grid_y):
+        if kriging_method.coordinates_type == "euclidean":
+            d = xp.hypot(row_x - x_data, row_y - y_data)
+        else:
+            d = _great_circle_distance(xp, row_x, row_y, x_data, y_data)
+
+        b = -_variogram(xp, kriging_method.variogram_model, kriging_method.variogram_model_parameters, d)
+        if kriging_method.exact_values:
+            b[xp.abs(d) <= kriging_method.eps] = 0.0
+        z_interpolated[row] = b @ weights[:n] + weights[n]
+
+    return z_interpolated
+
+
+def _execute_kriging(
+    kriging_method: Union[OrdinaryKriging, UniversalKriging],
+    grid_x: np.ndarray,
+    grid_y: np.ndarray,
+    method: Literal["ordinary", "universal"],
+    backend: Literal["vectorized", "loop", "C"],
+    n_closest_points: Optional[int],
+) -> np.ndarray:
+    if method == "universal":
+        z_interpolated, _ = kriging_method.execute("grid", grid_x, grid_y, backend=backend)
+    else:
+        z_interpolated, _ = kriging_method.execute(
+            "grid", grid_x, grid_y, backend=backend, n_closest_points=n_closest_points
+        )
+    return z_interpolated
+
+
+# Fitted model of a worker process, set once per worker by _init_kriging_worker
+_worker_kriging_method: Optional[Union[OrdinaryKriging, UniversalKriging]] = None
+
+
+def _init_kriging_worker(kriging_method: Union[OrdinaryKriging, UniversalKriging]) -> None:
+    global _worker_kriging_method
+    _worker_kriging_method = kriging_method
+
+
+def _execute_kriging_in_worker(
+    grid_x: np.ndarray,
+    grid_y: np.ndarray,
+    method: Literal["ordinary", "universal"],
+    backend: Literal["vectorized", "loop", "C"],
+    n_closest_points: Optional[int],
+) -> np.ndarray:
+    return _execute_kriging(_worker_kriging_method, grid_x, grid_y, method, backend, n_closest_points)
 
 
 def _kriging(
@@ -19,29 +183,69 @@ def _kriging(
     variogram_model: Literal["linear", "power", "gaussian", "spherical", "exponential"],
     coordinates_type: Literal["euclidean", "geographic"],
     method: Literal["ordinary", "universal"],
+    n_closest_points: Optional[int],
+    backend: Literal["vectorized", "loop", "C", "gpu"],
+    n_jobs: int,
 ) -> np.ndarray:
 
-    x = data.geometry.x
-    y = data.geometry.y
-    z = data[target_column].values
+    # get_x and get_y return contiguous float64 arrays directly, so no per-axis copies are needed
+    x = shapely.get_x(data.geometry.values)
+    y = shapely.get_y(data.geometry.values)
+    z = np.ascontiguousarray(data[target_column].to_numpy(dtype=np.float64))
 
     pixel_size_x = raster_transform.a
     pixel_size_y = abs(raster_transform.e)
     grid_x_min = raster_transform.xoff
-    grid_x_max = grid_x_min + raster_width * pixel_size_x
-    grid_y_max = raster_transform.yoff
-    grid_y_min = grid_y_max - raster_height * pixel_size_y
+    grid_y_min = raster_transform.yoff - raster_height * pixel_size_y
 
-    grid_x = np.arange(grid_x_min, grid_x_max, pixel_size_x)
-    grid_y = np.arange(grid_y_min, grid_y_max, pixel_size_y)
+    # Build the grids from the pixel counts, as np.arange with float steps can produce an extra node
+    grid_x = grid_x_min + np.arange(raster_width, dtype=np.float64) * pixel_size_x
+    grid_y = grid_y_min + np.arange(raster_height, dtype=np.float64) * pixel_size_y
 
-    if method == "universal":
-        kriging_method = UniversalKriging(x, y, z, variogram_model=variogram_model, drift_terms=["regional_linear"])
-    elif method == "ordinary":
-        kriging_method = OrdinaryKriging(x, y, z, variogram_model=variogram_model, coordinates_type=coordinates_type)
-    z_interpolated, _ = kriging_method.execute("grid", grid_x, grid_y)
+    if backend == "vectorized":
+        # The vectorized backend holds the distances and the kriging system right hand sides
+        # for all grid nodes in memory at once
+        required_memory = 2 * grid_x.size * grid_y.size * (x.size + 1) * np.dtype(np.float64).itemsize
+        physical_memory = _physical_memory()
+        if physical_memory is not None and required_memory > physical_memory:
+            warnings.warn(
+                f"Vectorized kriging is estimated to need {required_memory / 1024**3:.1f} GiB of memory, "
+                "which exceeds the physical memory. Consider the 'loop' or 'C' backend or n_closest_points.",
+                MemoryUsageWarning,
+            )
 
-    return z_interpolated
+    kriging_method = _fit_kriging(x.tobytes(), y.tobytes(), z.tobytes(), variogram_model, coordinates_type, method)
+    if backend == "gpu":
+        return cp.asnumpy(_ordinary_kriging_by_rows(kriging_method, grid_x, grid_y, cp))
+
+    n_jobs = min((os.cpu_count() or 1) if n_jobs == -1 else n_jobs, grid_y.size)
+    if n_jobs == 1:
+        return _execute_kriging(kriging_method, grid_x, grid_y, method, backend, n_closest_points)
+
+    # Grid rows are independent once the model is fitted, so bands of rows are solved in parallel. PyKrige
+    # holds the GIL in both the Python loop and the compiled backend, so separate processes are used and
+    # the fitted model is sent to each of them only once. Workers are spawned rather than forked, as forking
+    # a process that already runs threads (e.g. from Numba parallel functions) can deadlock
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_kriging_worker,
+        initargs=(kriging_method,),
+    ) as executor:
+        z_interpolated_bands = list(
+            executor.map(
+                partial(
+                    _execute_kriging_in_worker,
+                    grid_x,
+                    method=method,
+                    backend=backend,
+                    n_closest_points=n_closest_points,
+                ),
+                np.array_split(grid_y, n_jobs),
+            )
+        )
+
+    return np.vstack(z_interpolated_bands)
 
 
 @beartype
@@ -52,6 +256,9 @@ def kriging(
     variogram_model: Literal["linear", "power", "gaussian", "spherical", "exponential"] = "linear",
     coordinates_type: Literal["euclidean", "geographic"] = "geographic",
     method: Literal["ordinary", "universal"] = "ordinary",
+    n_closest_points: Optional[int] = None,
+    backend: Optional[Literal["vectorized", "loop", "C", "gpu"]] = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """
     Perform Kriging interpolation on the input data.
@@ -66,14 +273,36 @@ def kriging(
         coordinates_type: Determines are coordinates on a plane ('euclidean') or a sphere ('geographic').
             Used only in ordinary kriging. Defaults to 'geographic'.
         method: Ordinary or universal kriging. Defaults to 'ordinary'.
+        n_closest_points: Number of nearest points used to solve the kriging system for each grid node
+            (moving window kriging). Must be between two and the number of points. Reduces memory usage
+            considerably for large point sets. Used only in ordinary kriging. If None, all points are used.
+            Defaults to None.
+        backend: PyKrige backend used to solve the kriging system. 'vectorized' is fast but memory
+            intensive, 'loop' solves one grid node at a time and 'C' is a compiled version of the loop.
+            'gpu' fits the model on the CPU and predicts the grid row by row on a GPU, which requires CuPy
+            and a CUDA device.
+            'C' and 'gpu' are available only in ordinary kriging and only 'loop' and 'C' can be used
+            with n_closest_points.
+            If None, 'C' is used for ordinary kriging and 'vectorized' for universal kriging. If the compiled
+            extension is not available, 'C' falls back to 'loop'. Defaults to None.
+        n_jobs: Number of processes used to solve bands of grid rows in parallel. -1 uses all CPUs.
+            Starting the processes takes a moment, so this pays off for large grids. Scripts using more than
+            one process must call kriging under an `if __name__ == "__main__":` guard.
+            Not used with the 'gpu' backend. Defaults to 1.
 
     Returns:
         Numpy array containing the interpolated values.
 
     Raises:
         EmptyDataFrameException: The input GeoDataFrame is empty.
-        InvalidParameterValueException: Target column name is invalid or resolution is not greater than zero.
+        InvalidParameterValueException: Target column name is invalid, GeoDataFrame contains other geometries
+            than points, resolution is not greater than zero, n_closest_points is less than two, exceeds the
+            number of points or is used with universal kriging, backend is not compatible with the chosen
+            method or available, or n_jobs is not positive or -1.
         NonMatchingCrsException: The input GeoDataFrame and raster profile have mismatching CRS.
+
+    Warns:
+        MemoryUsageWarning: The vectorized backend is estimated to need more memory than is physically available.
     """
 
     if geodataframe.empty:
@@ -84,6 +313,29 @@ def kriging(
         raise InvalidParameterValueException(
             f"Expected target_column ({target_column}) to be contained in GeoDataFrame columns."
         )
+    if (geodataframe.geom_type != "Point").any():
+        raise InvalidParameterValueException("Expected all geometries in GeoDataFrame to be points.")
+    if n_closest_points is not None:
+        if not 2 <= n_closest_points <= len(geodataframe):
+            raise InvalidParameterValueException(
+                "Expected n_closest_points to be at least two and at most the number of points in GeoDataFrame."
+            )
+        if method == "universal":
+            raise InvalidParameterValueException("Expected n_closest_points to be used only with ordinary kriging.")
+        if backend in ("vectorized", "gpu"):
+            raise InvalidParameterValueException("Expected backend to be 'loop' or 'C' with n_closest_points.")
+    if backend in ("C", "gpu") and method == "universal":
+        raise InvalidParameterValueException("Expected backend to be 'vectorized' or 'loop' with universal kriging.")
+    if backend == "gpu" and not _CUPY_AVAILABLE:
+        raise InvalidParameterValueException("Expected CuPy and a CUDA device to use the 'gpu' backend.")
+
+    if n_jobs == 0 or n_jobs < -1:
+        raise InvalidParameterValueException("Expected n_jobs to be positive or -1.")
+
+    if backend is None:
+        backend = "C" if method == "ordinary" else "vectorized"
+    if backend == "C" and not _CYTHON_BACKEND_AVAILABLE:
+        backend = "loop"
 
     check_raster_profile(raster_profile)
 
@@ -100,6 +352,9 @@ def kriging(
         variogram_model,
         coordinates_type,
         method,
+        n_closest_points,
+        backend,
+        n_jobs,
     )
 
     return data_interpolated
@@ -2,6 +2,7 @@ import geopandas as gpd
 import numpy as np
 from beartype import beartype
 from beartype.typing import Literal, Optional, Union
+from geopandas.array import GeometryArray
 from rasterio import features, profiles, transform
 from rasterio.enums import MergeAlg
 
@@ -60,23 +61,25 @@ def rasterize_vector(
         raise InvalidColumnException(f"Expected value_column ({value_column}) to be contained in geodataframe columns.")
     check_raster_profile(raster_profile)
 
+    geometries = geodataframe.geometry.values
+    values = geodataframe[value_column].to_numpy(copy=False) if value_column is not None else None
+
     if buffer_value is not None:
         if buffer_value < 0:
             raise NumericValueSignException(f"Expected a positive buffer_value ({dict(buffer_value=buffer_value)})")
 
-        geodataframe = geodataframe.copy()
-        geodataframe["geometry"] = geodataframe["geometry"].apply(lambda geom: geom.buffer(buffer_value))
+        geometries = geometries.buffer(buffer_value)
 
     raster_width = raster_profile.get("width")
     raster_height = raster_profile.get("height")
     raster_transform = raster_profile.get("transform")
 
     out_image = _rasterize_vector(
-        geodataframe=geodataframe,
+        geometries=geometries,
+        values=values,
         raster_width=raster_width,
         raster_height=raster_height,
         raster_transform=raster_transform,
-        value_column=value_column,
         default_value=default_value,
         fill_value=fill_value,
         merge_alg=getattr(MergeAlg, merge_strategy),
@@ -85,11 +88,11 @@ def rasterize_vector(
 
 
 def _rasterize_vector(
-    geodataframe: gpd.GeoDataFrame,
+    geometries: GeometryArray,
+    values: Optional[np.ndarray],
     raster_width: int,
     raster_height: int,
     raster_transform: transform.Affine,
-    value_column: Optional[str],
     default_value: float,
     fill_value: float,
     merge_alg: MergeAlg,
@@ -100,12 +103,11 @@ def _rasterize_vector(
     # Alternatively, if there are not values for each geometry,
     # an iterable of geometries can be passed
 
-    geometries = geodataframe["geometry"].values
-    values = geodataframe[value_column].values if value_column is not None else None
-    geometry_value_pairs = list(geometries) if values is None else list(zip(geometries, values))
+    # The shapes are iterated only once, so they are passed lazily instead of as a list
+    shapes = geometries if values is None else zip(geometries, values)
 
     out_raster_array = features.rasterize(
-        shapes=geometry_value_pairs,
+        shapes=shapes,
         # fill and default_value can be floats even though typing claims otherwise
         fill=fill_value,
         default_value=default_value,
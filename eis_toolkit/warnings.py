@@ -4,3 +4,7 @@ class InvalidColumnWarning(Warning):
 
 class ClassificationFailedWarning(Warning):
     """Warning class for classification failures."""
+
+
+class MemoryUsageWarning(Warning):
+    """Warning class for operations estimated to exceed available memory."""
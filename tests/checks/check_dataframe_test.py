@@ -0,0 +1,52 @@
+import pandas as pd
+
+from eis_toolkit.utilities.checks.dataframe import check_columns_numeric, check_dataframe_contains_zeros
+
+df = pd.DataFrame(
+    {
+        "int": [1, 2],
+        "float": [1.0, 2.0],
+        "str": ["a", "b"],
+        "bool": [True, False],
+        "timedelta": pd.to_timedelta([1, 2], unit="s"),
+    }
+)
+
+
+def test_check_columns_numeric() -> None:
+    """Check that numeric and timedelta columns are considered numeric."""
+    assert check_columns_numeric(df, ["int", "float", "timedelta"])
+
+
+def test_check_columns_numeric_non_numeric() -> None:
+    """Check that string and boolean columns are not considered numeric."""
+    assert not check_columns_numeric(df, ["int", "str"])
+    assert not check_columns_numeric(df, ["bool"])
+
+
+def test_check_columns_numeric_missing_column() -> None:
+    """Check that a missing column returns False instead of raising."""
+    assert not check_columns_numeric(df, ["int", "missing"])
+
+
+def test_check_columns_numeric_duplicate_labels() -> None:
+    """Check that duplicated numeric column labels are considered numeric."""
+    duplicated_df = pd.DataFrame([[1, 2]], columns=["a", "a"])
+    assert check_columns_numeric(duplicated_df, ["a"])
+
+
+def test_check_dataframe_contains_zeros_mixed_dtypes() -> None:
+    """Check that zeros are found in a dataframe mixing numeric and string columns."""
+    assert check_dataframe_contains_zeros(pd.DataFrame({"float": [1.5, 0.0], "str": ["a", "b"]}))
+    assert not check_dataframe_contains_zeros(pd.DataFrame({"float": [1.5, 2.0], "str": ["a", "0"]}))
+
+
+def test_check_dataframe_contains_zeros_nullable() -> None:
+    """Check that missing values in a nullable integer column are not considered zeros."""
+    assert not check_dataframe_contains_zeros(pd.DataFrame({"int": pd.array([1, None], dtype="Int64")}))
+    assert check_dataframe_contains_zeros(pd.DataFrame({"int": pd.array([None, 0], dtype="Int64")}))
+
+
+def test_check_dataframe_contains_zeros_empty() -> None:
+    """Check that an empty dataframe does not contain zeros."""
+    assert not check_dataframe_contains_zeros(pd.DataFrame())
@@ -0,0 +1,40 @@
+import geopandas as gpd
+from rasterio.crs import CRS
+from shapely.geometry import Point
+
+from eis_toolkit.utilities.checks.raster import check_matching_crs
+
+crs_3067 = CRS.from_epsg(3067)
+crs_4326 = CRS.from_epsg(4326)
+
+
+def test_check_matching_crs_empty() -> None:
+    """Check that an empty iterable returns False."""
+    assert not check_matching_crs([])
+
+
+def test_check_matching_crs_mismatch() -> None:
+    """Check that a mismatching CRS after the first objects returns False."""
+    profiles = [{"crs": crs_3067}, {"crs": crs_3067}, {"crs": crs_4326}, {"crs": crs_3067}]
+    assert not check_matching_crs(profiles)
+
+
+def test_check_matching_crs_profile_without_crs() -> None:
+    """Check that a profile without CRS returns False."""
+    assert not check_matching_crs([{"crs": crs_3067}, {"width": 10}])
+
+
+def test_check_matching_crs_shared_instance() -> None:
+    """Check that objects sharing the same CRS instance return True."""
+    geodataframes = [gpd.GeoDataFrame(geometry=[Point(i, i)], crs=crs_3067) for i in range(3)]
+    assert check_matching_crs(geodataframes)
+
+
+def test_check_matching_crs_mismatch_between_objects() -> None:
+    """Check that objects with different CRS return False."""
+    geodataframes = [
+        gpd.GeoDataFrame(geometry=[Point(0, 0)], crs=crs_3067),
+        gpd.GeoDataFrame(geometry=[Point(0, 0)], crs=crs_3067),
+        gpd.GeoDataFrame(geometry=[Point(0, 0)], crs=crs_4326),
+    ]
+    assert not check_matching_crs(geodataframes)
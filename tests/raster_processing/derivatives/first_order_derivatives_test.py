@@ -87,6 +87,19 @@ def test_first_order(method: str):
                 )
 
 
+def test_negative_slope_tolerance():
+    """Test that a negative slope tolerance leaves the aspect unmodified."""
+    with rasterio.open(raster_path_single) as raster:
+        # The test raster has no pixels where both partial derivatives are zero,
+        # so with zero tolerance no flat pixels are replaced either
+        expected = first_order(raster, parameters=["A"], slope_tolerance=0)["A"][0]
+        aspect_array = first_order(raster, parameters=["A"], slope_tolerance=-1)["A"][0]
+
+        assert isinstance(aspect_array, np.ndarray)
+        np.testing.assert_array_equal(aspect_array, expected)
+        assert not np.any(aspect_array == -1)
+
+
 def test_number_bands():
     """Test if the number of bands is correct."""
     with rasterio.open(raster_path_multi) as raster:
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from eis_toolkit.exceptions import InvalidDataShapeException
+from eis_toolkit.raster_processing.derivatives.utilities import _set_flat_pixels
+
+rng = np.random.default_rng(0)
+in_array = rng.normal(size=(5, 6))
+in_array[0, 0] = np.nan
+p = rng.integers(-1, 2, size=(5, 6)).astype(np.float64)
+q = rng.integers(-1, 2, size=(5, 6)).astype(np.float64)
+p[1, 1] = np.nan
+slope_gradient = rng.uniform(0, np.pi / 2, size=(5, 6))
+slope_gradient[2, 2] = np.nan
+
+
+@pytest.mark.parametrize("parameter", ["A", "planc"])
+def test_set_flat_pixels_from_derivatives(parameter: str) -> None:
+    """Test that pixels with zero partial derivatives match the np.where reference."""
+    replacement_value = -1 if parameter == "A" else 0
+    expected = np.where(np.logical_and(p == 0, q == 0), replacement_value, in_array)
+
+    out_array = _set_flat_pixels(in_array, (p, q), 0, parameter)
+
+    np.testing.assert_array_equal(out_array, expected)
+    assert not np.shares_memory(out_array, in_array)
+
+
+@pytest.mark.parametrize("parameter", ["A", "planc"])
+def test_set_flat_pixels_from_slope(parameter: str) -> None:
+    """Test that pixels within the slope tolerance match the np.where reference."""
+    replacement_value = -1 if parameter == "A" else 0
+    expected = np.where(slope_gradient <= np.radians(20), replacement_value, in_array)
+
+    out_array = _set_flat_pixels(in_array, slope_gradient, 20, parameter)
+
+    np.testing.assert_array_equal(out_array, expected)
+
+
+def test_set_flat_pixels_negative_tolerance() -> None:
+    """Test that the input array is returned as is with a negative slope tolerance."""
+    assert _set_flat_pixels(in_array, slope_gradient, -1, "A") is in_array
+
+
+def test_set_flat_pixels_shape_mismatch() -> None:
+    """Test that mismatching slope gradient or partial derivatives raise the correct exception."""
+    with pytest.raises(InvalidDataShapeException):
+        _set_flat_pixels(in_array, (p[:-1], q[:-1]), 0, "A")
+    with pytest.raises(InvalidDataShapeException):
+        _set_flat_pixels(in_array, slope_gradient.T, 20, "A")
@@ -1,13 +1,26 @@
+import importlib
+import sys
+from types import ModuleType, SimpleNamespace
+
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 import pytest
 from beartype.roar import BeartypeCallHintParamViolation
+from pykrige.ok import OrdinaryKriging
 from rasterio import crs, transform
+from shapely.geometry import box
 
 from eis_toolkit.exceptions import EmptyDataFrameException, InvalidParameterValueException, NonMatchingCrsException
 from eis_toolkit.utilities.raster import profile_from_extent_and_pixel_size
-from eis_toolkit.vector_processing.kriging_interpolation import kriging
+from eis_toolkit.vector_processing import kriging_interpolation
+from eis_toolkit.vector_processing.kriging_interpolation import (
+    _CUPY_AVAILABLE,
+    _fit_kriging,
+    _ordinary_kriging_by_rows,
+    kriging,
+)
+from eis_toolkit.warnings import MemoryUsageWarning
 
 np.random.seed(0)
 x = np.random.uniform(0, 5, size=(10, 1))
@@ -58,6 +71,22 @@ def test_invalid_column():
         kriging(geodataframe=gdf, target_column="invalid_column", raster_profile=raster_profile)
 
 
+def test_mixed_geometries():
+    """Test that a GeoDataFrame with non-point geometries raises the correct exception."""
+    mixed_gdf = gdf.copy()
+    mixed_gdf.loc[0, "geometry"] = box(0, 0, 1, 1)
+    with pytest.raises(InvalidParameterValueException):
+        kriging(geodataframe=mixed_gdf, target_column=target_column, raster_profile=raster_profile)
+
+
+def test_polygon_geometries():
+    """Test that a GeoDataFrame with only polygon geometries raises the correct exception."""
+    polygon_gdf = gdf.copy()
+    polygon_gdf["geometry"] = polygon_gdf.geometry.buffer(0.1)
+    with pytest.raises(InvalidParameterValueException):
+        kriging(geodataframe=polygon_gdf, target_column=target_column, raster_profile=raster_profile)
+
+
 def test_mismatching_crs():
     """Test that mismatching CRS of raster profile and geodataframe raises the correct exception."""
     meta = {
@@ -106,3 +135,180 @@ def test_invalid_method():
     """Test that invalid kriging method raises the correct exception."""
     with pytest.raises(BeartypeCallHintParamViolation):
         kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, method="invalid_method")
+
+
+def test_ordinary_kriging_n_closest_points():
+    """Test that moving window ordinary kriging with all points matches the regular output."""
+    z_interpolated = kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile)
+    z_interpolated_window = kriging(
+        geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, n_closest_points=len(gdf)
+    )
+    assert z_interpolated_window.shape == expected_shape
+    np.testing.assert_almost_equal(z_interpolated_window, z_interpolated, 4)
+
+
+def test_invalid_n_closest_points():
+    """Test that invalid n_closest_points raises the correct exception."""
+    with pytest.raises(InvalidParameterValueException):
+        kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, n_closest_points=0)
+    with pytest.raises(InvalidParameterValueException):
+        kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, n_closest_points=1)
+    with pytest.raises(InvalidParameterValueException):
+        kriging(
+            geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, n_closest_points=len(gdf) + 1
+        )
+    with pytest.raises(InvalidParameterValueException):
+        kriging(
+            geodataframe=gdf,
+            target_column=target_column,
+            raster_profile=raster_profile,
+            method="universal",
+            n_closest_points=5,
+        )
+
+
+@pytest.mark.parametrize("backend", ["vectorized", "loop", "C"])
+def test_ordinary_kriging_backends(backend):
+    """Test that all backends produce the same ordinary kriging output."""
+    z_interpolated = kriging(
+        geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, backend=backend
+    )
+    np.testing.assert_almost_equal(z_interpolated[0][0], 0.4216, 4)
+    np.testing.assert_almost_equal(z_interpolated[-1][-1], 1.5815, 4)
+
+
+def test_invalid_backend():
+    """Test that backend incompatible with other parameters raises the correct exception."""
+    with pytest.raises(InvalidParameterValueException):
+        kriging(
+            geodataframe=gdf,
+            target_column=target_column,
+            raster_profile=raster_profile,
+            method="universal",
+            backend="C",
+        )
+    with pytest.raises(InvalidParameterValueException):
+        kriging(
+            geodataframe=gdf,
+            target_column=target_column,
+            raster_profile=raster_profile,
+            n_closest_points=5,
+            backend="vectorized",
+        )
+
+
+def test_kriging_reuses_fitted_model():
+    """Test that repeated kriging with identical data reuses the fitted model."""
+    _fit_kriging.cache_clear()
+    first = kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile)
+    second = kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile)
+    assert _fit_kriging.cache_info().hits == 1
+    np.testing.assert_array_equal(first, second)
+
+
+@pytest.mark.parametrize("variogram_model", ["linear", "power", "gaussian", "spherical", "exponential"])
+@pytest.mark.parametrize("coordinates_type", ["euclidean", "geographic"])
+def test_ordinary_kriging_by_rows(variogram_model, coordinates_type):
+    """Test that the row by row prediction used by the GPU backend matches PyKrige."""
+    ordinary_kriging = OrdinaryKriging(
+        x.ravel(), y.ravel(), z.ravel(), variogram_model=variogram_model, coordinates_type=coordinates_type
+    )
+    grid_x = np.arange(0, 5, 0.5)
+    grid_y = np.arange(0, 5, 0.5)
+    expected, _ = ordinary_kriging.execute("grid", grid_x, grid_y)
+    z_interpolated = _ordinary_kriging_by_rows(ordinary_kriging, grid_x, grid_y, np)
+    np.testing.assert_almost_equal(z_interpolated, expected, 10)
+
+
+@pytest.mark.skipif(_CUPY_AVAILABLE, reason="CuPy is installed")
+def test_gpu_backend_without_cupy():
+    """Test that using the GPU backend without CuPy raises the correct exception."""
+    with pytest.raises(InvalidParameterValueException):
+        kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, backend="gpu")
+
+
+def _raise_no_device():
+    raise RuntimeError("cudaErrorNoDevice: no CUDA-capable device is detected")
+
+
+@pytest.mark.parametrize("get_device_count", [_raise_no_device, lambda: 0])
+def test_gpu_backend_without_cuda_device(monkeypatch, get_device_count):
+    """Test that CuPy without a usable CUDA device is treated as unavailable."""
+    fake_cupy = ModuleType("cupy")
+    fake_cupy.cuda = SimpleNamespace(runtime=SimpleNamespace(getDeviceCount=get_device_count))
+    monkeypatch.setitem(sys.modules, "cupy", fake_cupy)
+    try:
+        importlib.reload(kriging_interpolation)
+        assert not kriging_interpolation._CUPY_AVAILABLE
+        with pytest.raises(InvalidParameterValueException):
+            kriging_interpolation.kriging(
+                geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, backend="gpu"
+            )
+    finally:
+        monkeypatch.undo()
+        importlib.reload(kriging_interpolation)
+
+
+def test_kriging_grid_size_matches_profile():
+    """Test that the output grid matches the raster profile even when the pixel size is not exact in binary."""
+    profile = {"transform": transform.from_origin(0, 0.3, 0.1, 0.1), "crs": gdf.crs, "width": 3, "height": 3}
+    z_interpolated = kriging(geodataframe=gdf, target_column=target_column, raster_profile=profile)
+    assert z_interpolated.shape == (3, 3)
+
+
+def test_vectorized_kriging_memory_warning(monkeypatch):
+    """Test that vectorized kriging warns when it is estimated to exceed the physical memory."""
+    monkeypatch.setattr(kriging_interpolation, "_physical_memory", lambda: 1)
+    with pytest.warns(MemoryUsageWarning):
+        kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, backend="vectorized")
+
+
+@pytest.mark.parametrize("method", ["ordinary", "universal"])
+def test_kriging_n_jobs(method):
+    """Test that solving grid row bands in parallel gives the same output as a single job."""
+    z_interpolated = kriging(
+        geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, method=method
+    )
+    z_interpolated_parallel = kriging(
+        geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, method=method, n_jobs=3
+    )
+    np.testing.assert_almost_equal(z_interpolated_parallel, z_interpolated, 10)
+
+
+def test_invalid_n_jobs():
+    """Test that invalid n_jobs raises the correct exception."""
+    with pytest.raises(InvalidParameterValueException):
+        kriging(geodataframe=gdf, target_column=target_column, raster_profile=raster_profile, n_jobs=0)
+
+
+class _NumpyBackedCupy:
+    """Stand-in for CuPy that runs the GPU backend with numpy."""
+
+    asnumpy = staticmethod(np.asarray)
+
+    def __getattr__(self, name):
+        return getattr(np, name)
+
+
+@pytest.mark.parametrize("coordinates_type", ["euclidean", "geographic"])
+def test_gpu_backend(monkeypatch, coordinates_type):
+    """Test that the GPU backend matches the compiled backend when CuPy is replaced with numpy."""
+    monkeypatch.setattr(kriging_interpolation, "cp", _NumpyBackedCupy(), raising=False)
+    monkeypatch.setattr(kriging_interpolation, "_CUPY_AVAILABLE", True)
+    expected = kriging(
+        geodataframe=gdf,
+        target_column=target_column,
+        raster_profile=raster_profile,
+        coordinates_type=coordinates_type,
+        backend="C",
+    )
+    z_interpolated = kriging(
+        geodataframe=gdf,
+        target_column=target_column,
+        raster_profile=raster_profile,
+        coordinates_type=coordinates_type,
+        backend="gpu",
+    )
+    assert isinstance(z_interpolated, np.ndarray)
+    assert z_interpolated.shape == expected_shape
+    np.testing.assert_almost_equal(z_interpolated, expected, 10)